@@ -1,18 +1,23 @@
-import json
+import hashlib
 import logging
 import os
+import queue
 import random
 import re
 import threading
 import time
 from collections import deque
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+from uuid import uuid4
 
+import orjson
 import yaml
 from apscheduler.schedulers.background import BackgroundScheduler
 from dotenv import load_dotenv
 from flask import Flask, Response, jsonify, redirect, render_template, request, session
+from flask.json.provider import JSONProvider
 from flask_compress import Compress
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
@@ -20,7 +25,16 @@ from flask_talisman import Talisman
 from loguru import logger
 from pydantic import BaseModel, ValidationError
 
-from generator import _deduplicate, ensure_pool, generate_answers, get_status, load_answers, save_answers
+from generator import (
+    _deduplicate,
+    _resolve_key,
+    ensure_pool,
+    generate_answers,
+    generate_answers_parallel,
+    get_status,
+    load_answers,
+    save_answers,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -48,15 +62,17 @@ logging.basicConfig(handlers=[_InterceptHandler()], level=0, force=True)
 # ---------------------------------------------------------------------------
 
 _log_buffer: deque = deque(maxlen=200)
+_log_lock = threading.Lock()
 
 
 def _log_sink(message) -> None:  # type: ignore[no-untyped-def]
+    # Nur das rohe Tupel puffern – strftime + Dict-Bau passieren erst
+    # beim (seltenen) Abruf über das Admin-Panel
     record = message.record
-    _log_buffer.append({
-        "time": record["time"].strftime("%H:%M:%S"),
-        "level": record["level"].name,
-        "message": record["message"],
-    })
+    # Unter demselben Lock wie der Abruf – sonst kann ein Append während
+    # list(_log_buffer) im Admin-Panel die Iteration zerschießen
+    with _log_lock:
+        _log_buffer.append((record["time"], record["level"].name, record["message"]))
 
 
 logger.add(_log_sink, level="INFO")
@@ -100,9 +116,21 @@ class _AppCfg(BaseModel):
 # .env automatisch laden (für lokale Entwicklung ohne manuelles `source .env`)
 load_dotenv()
 
-CONFIG_FILE = Path(__file__).parent / "config.yaml"
+APP_DIR = Path(__file__).parent.resolve()
+CONFIG_FILE = APP_DIR / "config.yaml"
+
+class _OrjsonProvider(JSONProvider):
+    """JSON über orjson – schnellere (De-)Serialisierung für alle jsonify-Antworten."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=str).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = _OrjsonProvider(app)
 app.secret_key = os.environ.get("SESSION_SECRET", "dev-secret-change-me")
 
 Compress(app)
@@ -122,27 +150,54 @@ limiter = Limiter(
 )
 
 
+# Mtime-Cache: unveränderte config.yaml/prompt.txt werden bei Reload
+# nicht erneut geparst (YAML-Parse ist der teure Teil)
+_config_cache: dict = {"mtime": -1, "prompt_mtime": -1, "cfg": None}
+
+
+def _load_prompt(cfg: dict) -> None:
+    """Liest die Prompt-Datei in cfg ein und merkt sich deren mtime."""
+    prompt_file = cfg["speech"].get("prompt_file")
+    if not prompt_file:
+        return
+    p = CONFIG_FILE.parent / prompt_file
+    if p.exists():
+        cfg["speech"]["prompt"] = p.read_text(encoding="utf-8")
+        _config_cache["prompt_mtime"] = p.stat().st_mtime_ns
+    else:
+        cfg["speech"].setdefault("prompt", "")
+        _config_cache["prompt_mtime"] = -1
+        logger.warning("prompt_file '{}' nicht gefunden – leerer Prompt wird verwendet.", prompt_file)
+
+
 def load_config() -> dict:
+    st = CONFIG_FILE.stat()
+    cached = _config_cache["cfg"]
+    if cached is not None and st.st_mtime_ns == _config_cache["mtime"]:
+        # YAML unverändert – nur die Prompt-Datei separat prüfen
+        prompt_file = cached["speech"].get("prompt_file")
+        if prompt_file:
+            p = CONFIG_FILE.parent / prompt_file
+            pm = p.stat().st_mtime_ns if p.exists() else -1
+            if pm != _config_cache["prompt_mtime"]:
+                _load_prompt(cached)
+        return cached
     with open(CONFIG_FILE, "r", encoding="utf-8") as f:
         cfg = yaml.safe_load(f)
     try:
         _AppCfg(**cfg)
     except ValidationError as e:
         logger.warning("config.yaml Validierungsfehler:\n{}", e)
-    prompt_file = cfg["speech"].get("prompt_file")
-    if prompt_file:
-        p = CONFIG_FILE.parent / prompt_file
-        if p.exists():
-            cfg["speech"]["prompt"] = p.read_text(encoding="utf-8")
-        else:
-            cfg["speech"].setdefault("prompt", "")
-            logger.warning("prompt_file '{}' nicht gefunden – leerer Prompt wird verwendet.", prompt_file)
+    _load_prompt(cfg)
+    _config_cache["cfg"] = cfg
+    _config_cache["mtime"] = st.st_mtime_ns
     return cfg
 
 
 config = load_config()
 
 _queue: list[str] = []
+_queue_end = 0
 _queue_lock = threading.Lock()
 
 
@@ -175,31 +230,56 @@ def _audit(action: str, detail: str = "") -> None:
 # ---------------------------------------------------------------------------
 
 def _pop_answer() -> dict:
-    """Thread-sicher: nächste Antwort aus der shuffled Queue."""
-    global _queue
+    """Thread-sicher: nächste Antwort, lazy Fisher–Yates statt Voll-Shuffle.
+
+    Pro Pop wird nur ein Element an Position `_queue_end - 1` getauscht –
+    amortisiert O(1), gleichverteilt, Allokation nur beim Refill.
+    """
+    global _queue, _queue_end
+    # Disk-I/O außerhalb des Locks – langsames Nachladen blockiert so
+    # keine anderen SSE-Konsumenten.
+    answers = load_answers() if _queue_end == 0 else None
     with _queue_lock:
-        if not _queue:
-            answers = load_answers()
+        if _queue_end == 0:
+            if answers is None:
+                answers = load_answers()
             if not answers:
                 return {"answer": "Lade Tipp…", "pool_size": 0}
-            _queue = answers.copy()
-            random.shuffle(_queue)
-        answer = _queue.pop()
-        remaining = len(_queue)
-    return {"answer": answer, "pool_size": remaining}
+            _queue = answers  # load_answers liefert bereits eine frische Kopie
+            _queue_end = len(_queue)
+        i = _queue_end - 1
+        j = random.randrange(i + 1)
+        _queue[i], _queue[j] = _queue[j], _queue[i]
+        _queue_end -= 1
+        return {"answer": _queue[i], "pool_size": _queue_end}
 
 
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
 
+# Gerenderte Startseite pro Maskottchen-Konfiguration cachen – erspart
+# den Jinja-Render auf der heißesten öffentlichen Route
+_index_cache: dict[tuple, bytes] = {}
+
+
 @app.route("/")
 def index():
-    return render_template(
-        "index.html",
-        mascot_name=config["mascot"]["name"],
-        mascot_image=config["mascot"]["image"],
-    )
+    key = (config["mascot"]["name"], config["mascot"]["image"])
+    body = _index_cache.get(key)
+    if body is None:
+        body = render_template(
+            "index.html",
+            mascot_name=key[0],
+            mascot_image=key[1],
+        ).encode()
+        _index_cache[key] = body
+    response = app.make_response(body)
+    response.headers["Cache-Control"] = "public, max-age=60"
+    # ETag über den gerenderten Body, nicht den Cache-Key – sonst liefert
+    # ein Revalidate nach Template-Deploy ewig 304 auf die alte Seite
+    response.set_etag(hashlib.sha1(body).hexdigest())
+    return response.make_conditional(request)
 
 
 @app.route("/api/answer")
@@ -210,59 +290,155 @@ def api_answer():
     return jsonify(data)
 
 
+# Ein Broadcaster-Thread bedient alle SSE-Clients: ein Pop + ein Encode
+# pro Intervall statt einem pro Client. (Jede Verbindung hält weiterhin
+# einen gthread-Worker in q.get – nur die Tick-Arbeit ist dedupliziert.)
+_sse_subscribers: set = set()
+_sse_lock = threading.Lock()
+_sse_thread: Optional[threading.Thread] = None
+_sse_last_msg: Optional[bytes] = None  # zuletzt gesendeter Frame für neue Subscriber
+
+
+def _sse_broadcast_loop() -> None:
+    global _sse_last_msg
+    while True:
+        # Kein Throw darf den Singleton-Thread töten – sonst bekämen alle
+        # Clients nur noch Keepalives und die Screens frören stillschweigend ein
+        try:
+            interval = int(config["speech"]["auto_refresh_seconds"])
+            time.sleep(interval)
+            with _sse_lock:
+                subscribers = list(_sse_subscribers)
+            if not subscribers:
+                continue
+            # Einmal pro Tick encoden, alle Subscriber bekommen dieselben Bytes
+            msg = b"data: " + orjson.dumps(_pop_answer()) + b"\n\n"
+            _sse_last_msg = msg
+            for q in subscribers:
+                try:
+                    q.put_nowait(msg)
+                except queue.Full:
+                    pass  # langsamer Client: Update verwerfen statt puffern
+        except Exception as e:
+            logger.error("SSE-Broadcaster-Tick fehlgeschlagen: {}", e)
+            time.sleep(5)
+
+
+def _ensure_sse_thread() -> None:
+    global _sse_thread
+    with _sse_lock:
+        if _sse_thread is None:
+            _sse_thread = threading.Thread(target=_sse_broadcast_loop, daemon=True)
+            _sse_thread.start()
+
+
 @app.route("/api/stream")
 def api_stream():
     """Server-Sent Events: schickt alle auto_refresh_seconds einen neuen Tipp."""
-    interval = int(config["speech"]["auto_refresh_seconds"])
+    _ensure_sse_thread()
 
     def generate():
-        yield f"data: {json.dumps(_pop_answer())}\n\n"
-        while True:
-            time.sleep(interval)
-            yield f"data: {json.dumps(_pop_answer())}\n\n"
+        q: queue.Queue = queue.Queue(maxsize=1)
+        with _sse_lock:
+            _sse_subscribers.add(q)
+        try:
+            # Erster Frame ohne Pop+Encode, wenn schon ein Broadcast lief
+            first = _sse_last_msg
+            yield first if first is not None else b"data: " + orjson.dumps(_pop_answer()) + b"\n\n"
+            while True:
+                try:
+                    timeout = int(config["speech"]["auto_refresh_seconds"]) * 4
+                    msg = q.get(timeout=timeout)
+                except queue.Empty:
+                    yield b": keepalive\n\n"
+                    continue
+                yield msg
+        finally:
+            with _sse_lock:
+                _sse_subscribers.discard(q)
 
     return Response(
         generate(),
         mimetype="text/event-stream",
+        direct_passthrough=True,
         headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
-@app.route("/api/generate", methods=["POST"])
-@limiter.limit("5 per minute")
-def api_generate():
-    try:
-        pool_cfg = config["speech"]["pool"]
-        per_request = pool_cfg["answers_per_request"]
-        max_size = pool_cfg["max_size"]
-
-        reset = request.args.get("reset", "false").lower() == "true"
-        current = [] if reset else load_answers()
-        min_size = pool_cfg["min_size"]
-
-        # Beim Reset: auffüllen bis min_size (ggf. mehrere API-Calls)
-        target = min_size if reset else max_size
-        total_generated = 0
+# In-Prozess-Job-Registry: /api/generate blockiert keinen Worker mehr,
+# der Fortschritt ist über /api/generate/<job_id> abfragbar.
+_gen_jobs: dict[str, dict] = {}
+_gen_lock = threading.Lock()
+_gen_semaphore = threading.Semaphore(1)  # nie zwei Generierungen gleichzeitig
 
-        while len(current) < target:
-            count = min(per_request, target - len(current))
-            if count <= 0:
-                break
-            new_answers = generate_answers(config, count)
-            current = current + new_answers
-            total_generated += len(new_answers)
 
-        if len(current) > max_size:
-            current = current[-max_size:]
+def _run_generate_job(job_id: str, reset: bool) -> None:
+    job = _gen_jobs[job_id]
+    with _gen_semaphore:
+        job["state"] = "running"
+        try:
+            pool_cfg = config["speech"]["pool"]
+            per_request = pool_cfg["answers_per_request"]
+            max_size = pool_cfg["max_size"]
+            min_size = pool_cfg["min_size"]
+
+            current = [] if reset else load_answers()
+            # Beim Reset: auffüllen bis min_size (ggf. mehrere API-Calls parallel)
+            target = min_size if reset else max_size
+            total_generated = 0
+
+            deficit = target - len(current)
+            if deficit > 0:
+                new_answers = generate_answers_parallel(config, deficit, per_request)
+                current.extend(new_answers)
+                total_generated = len(new_answers)
+
+            if len(current) > max_size:
+                del current[:-max_size]
+
+            if total_generated:
+                save_answers(current)
+            job.update({
+                "state": "done",
+                "status": "ok" if total_generated else "pool_full",
+                "generated": total_generated,
+                "total": len(current),
+            })
+        except Exception:
+            logger.exception("Fehler im Generate-Job {}", job_id)
+            job.update({"state": "error", "status": "error", "message": "Interner Fehler"})
+
+
+def _prune_gen_jobs() -> None:
+    """Hält die Job-Registry klein (nur unter _gen_lock aufrufen)."""
+    finished = [jid for jid, j in _gen_jobs.items() if j["state"] in ("done", "error")]
+    for jid in finished[:-20]:
+        del _gen_jobs[jid]
 
-        if total_generated == 0:
-            return jsonify({"status": "pool_full", "total": len(current), "generated": 0})
 
-        save_answers(current)
-        return jsonify({"status": "ok", "generated": total_generated, "total": len(current)})
-    except Exception:
-        logger.exception("Fehler bei /api/generate")
-        return jsonify({"status": "error", "message": "Interner Fehler"}), 500
+@app.route("/api/generate", methods=["POST"])
+@limiter.limit("5 per minute")
+def api_generate():
+    reset = request.args.get("reset", "false").lower() == "true"
+    with _gen_lock:
+        # Single-Flight: läuft bereits ein gleichartiger Refill, hängen
+        # sich weitere Aufrufer an dessen Job statt neu zu generieren.
+        for jid, job in _gen_jobs.items():
+            if job["state"] in ("queued", "running") and job["reset"] == reset:
+                return jsonify({"status": "accepted", "job_id": jid, "coalesced": True}), 202
+        _prune_gen_jobs()
+        job_id = uuid4().hex
+        _gen_jobs[job_id] = {"state": "queued", "reset": reset, "generated": 0}
+    threading.Thread(target=_run_generate_job, args=(job_id, reset), daemon=True).start()
+    return jsonify({"status": "accepted", "job_id": job_id}), 202
+
+
+@app.route("/api/generate/<job_id>")
+def api_generate_status(job_id: str):
+    job = _gen_jobs.get(job_id)
+    if job is None:
+        return jsonify({"status": "error", "message": "Unbekannte Job-ID"}), 404
+    return jsonify({"status": "ok", "job": job})
 
 
 @app.route("/api/rotate", methods=["POST"])
@@ -272,11 +448,11 @@ def api_rotate():
         per_request = config["speech"]["pool"]["answers_per_request"]
         current = load_answers()
         # Erste N löschen
-        current = current[per_request:]
+        del current[:per_request]
         # N neue generieren, deduplizieren und anhängen
         raw = generate_answers(config, per_request)
         new_answers = _deduplicate(raw, current) or raw[:max(1, per_request)]
-        current = current + new_answers
+        current.extend(new_answers)
         save_answers(current)
         return jsonify({"status": "ok", "removed": per_request, "added": len(new_answers), "total": len(current)})
     except Exception:
@@ -319,6 +495,12 @@ def admin_logout():
 # Admin – Dashboard
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=8)
+def _key_status_for(env_vars: tuple[str, ...]) -> dict:
+    """Gecachter Key-Status pro Provider-Satz; admin_api_keys invalidiert."""
+    return {var: len(os.environ.get(var, "")) >= 20 for var in env_vars}
+
+
 @app.route("/admin")
 @_require_admin
 def admin_dashboard():
@@ -326,11 +508,9 @@ def admin_dashboard():
     providers = config.get("providers", {})
     active_provider = config["ai"]["provider"]
     fallback_provider = config["ai"].get("fallback_provider", "")
-    key_status = {
-        cfg["api_key_env"]: len(os.environ.get(cfg["api_key_env"], "")) >= 20
-        for cfg in providers.values()
-        if cfg.get("api_key_env")
-    }
+    key_status = _key_status_for(tuple(sorted(
+        cfg["api_key_env"] for cfg in providers.values() if cfg.get("api_key_env")
+    )))
     return render_template(
         "admin.html",
         status=status,
@@ -373,9 +553,9 @@ def admin_api_generate():
         max_size = config["speech"]["pool"]["max_size"]
         current = load_answers()
         new_answers = generate_answers(config, per_request)
-        current = current + new_answers
+        current.extend(new_answers)
         if len(current) > max_size:
-            current = current[-max_size:]
+            del current[:-max_size]
         save_answers(current)
         _audit("manual_generate", f"generated={len(new_answers)} total={len(current)}")
         return jsonify({"status": "ok", "generated": len(new_answers), "total": len(current)})
@@ -391,10 +571,10 @@ def admin_api_rotate():
     try:
         per_request = config["speech"]["pool"]["answers_per_request"]
         current = load_answers()
-        current = current[per_request:]
+        del current[:per_request]
         raw = generate_answers(config, per_request)
         new_answers = _deduplicate(raw, current) or raw[:max(1, per_request)]
-        current = current + new_answers
+        current.extend(new_answers)
         save_answers(current)
         _audit("manual_rotate", f"removed={per_request} added={len(new_answers)}")
         return jsonify({"status": "ok", "removed": per_request, "added": len(new_answers), "total": len(current)})
@@ -408,6 +588,8 @@ def admin_api_rotate():
 # ---------------------------------------------------------------------------
 
 _ruamel = None
+_yaml_doc_cache: dict = {"mtime": -1, "doc": None}
+_yaml_lock = threading.Lock()
 
 
 def _get_ruamel():
@@ -420,28 +602,40 @@ def _get_ruamel():
     return _ruamel
 
 
+def _load_yaml_doc():
+    """Lädt das ruamel-Dokument, mtime-gecacht (nur unter _yaml_lock aufrufen)."""
+    st = CONFIG_FILE.stat()
+    if _yaml_doc_cache["doc"] is None or st.st_mtime_ns != _yaml_doc_cache["mtime"]:
+        _yaml_doc_cache["doc"] = _get_ruamel().load(CONFIG_FILE)
+        _yaml_doc_cache["mtime"] = st.st_mtime_ns
+    return _yaml_doc_cache["doc"]
+
+
+def _patch_yaml_many(updates: list[tuple[str, str, object]]) -> None:
+    """Setzt mehrere `(section_path, key, value)`-Tripel mit einem Load/Dump.
+
+    section_path: z.B. 'ai', 'speech' oder 'speech.pool'
+    """
+    with _yaml_lock:
+        doc = _load_yaml_doc()
+        for section_path, key, value in updates:
+            node = doc
+            for part in section_path.split("."):
+                node = node[part]
+            node[key] = value
+        with open(CONFIG_FILE, "w", encoding="utf-8") as f:
+            _get_ruamel().dump(doc, f)
+        _yaml_doc_cache["mtime"] = CONFIG_FILE.stat().st_mtime_ns
+
+
 def _patch_config_yaml(key: str, value) -> None:
     """Setzt `key` im ai:-Block der config.yaml (kommentar-erhaltend)."""
-    ry = _get_ruamel()
-    data = ry.load(CONFIG_FILE)
-    data["ai"][key] = str(value) if value is not None else None
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        ry.dump(data, f)
+    _patch_yaml_many([("ai", key, str(value) if value is not None else None)])
 
 
 def _patch_yaml_value(section_path: str, key: str, value) -> None:
-    """Setzt `key: value` in einem hierarchischen YAML-Pfad (erhält Kommentare).
-
-    section_path: z.B. 'speech' oder 'speech.pool'
-    """
-    ry = _get_ruamel()
-    data = ry.load(CONFIG_FILE)
-    node = data
-    for part in section_path.split("."):
-        node = node[part]
-    node[key] = value
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        ry.dump(data, f)
+    """Setzt `key: value` in einem hierarchischen YAML-Pfad (erhält Kommentare)."""
+    _patch_yaml_many([(section_path, key, value)])
 
 
 @app.route("/admin/api/provider", methods=["POST"])
@@ -473,6 +667,10 @@ def admin_api_fallback():
     return jsonify({"status": "ok", "fallback_provider": name})
 
 
+_ENV_NAME_RE = re.compile(r"[A-Z][A-Z_0-9]*")
+_env_lock = threading.Lock()
+
+
 @app.route("/admin/api/keys", methods=["POST"])
 @_require_admin
 def admin_api_keys():
@@ -481,24 +679,34 @@ def admin_api_keys():
     value = data.get("value", "")
     if not env_var:
         return jsonify({"status": "error", "message": "env_var fehlt"}), 400
-    if not re.fullmatch(r"[A-Z][A-Z_0-9]*", env_var):
+    if not _ENV_NAME_RE.fullmatch(env_var):
         return jsonify({"status": "error", "message": "Ungültiger Variablenname"}), 400
     # 1. Sofort im laufenden Prozess setzen
     os.environ[env_var] = value
+    _key_status_for.cache_clear()
+    _resolve_key.cache_clear()
     # 2. In .env-Datei persistieren (Wert in Anführungszeichen, Sonderzeichen escapen)
     safe_value = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "").replace("\r", "")
     env_line = f'{env_var}="{safe_value}"'
     env_path = Path(__file__).parent / ".env"
-    lines = env_path.read_text(encoding="utf-8").splitlines() if env_path.exists() else []
-    updated = False
-    for i, line in enumerate(lines):
-        if line.startswith(f"{env_var}="):
-            lines[i] = env_line
-            updated = True
-            break
-    if not updated:
-        lines.append(env_line)
-    env_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    with _env_lock:
+        lines = env_path.read_text(encoding="utf-8").splitlines() if env_path.exists() else []
+        updated = False
+        for i, line in enumerate(lines):
+            if line.startswith(f"{env_var}="):
+                if line == env_line:
+                    # Wert unverändert – Rewrite der Datei sparen
+                    _audit("key_update", env_var)
+                    return jsonify({"status": "ok"})
+                lines[i] = env_line
+                updated = True
+                break
+        if not updated:
+            lines.append(env_line)
+        # Atomisch via Temp-Datei + Rename – kein zerrissenes .env bei Absturz
+        tmp_path = env_path.parent / ".env.tmp"
+        tmp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        os.replace(tmp_path, env_path)
     _audit("key_update", env_var)
     return jsonify({"status": "ok"})
 
@@ -507,13 +715,26 @@ def admin_api_keys():
 # Admin – Prompt-Editor
 # ---------------------------------------------------------------------------
 
+_prompt_path_cache: dict[str, Optional[Path]] = {}
+
+
+def _resolve_prompt_path(prompt_file: str) -> Optional[Path]:
+    """Auflösung + Pfad-Safety-Check, memoisiert pro prompt_file-Wert.
+
+    Gibt None zurück, wenn der Pfad aus dem App-Verzeichnis herausführt.
+    """
+    if prompt_file not in _prompt_path_cache:
+        p = (APP_DIR / prompt_file).resolve()
+        _prompt_path_cache[prompt_file] = p if p.is_relative_to(APP_DIR) else None
+    return _prompt_path_cache[prompt_file]
+
+
 @app.route("/admin/api/prompt", methods=["GET"])
 @_require_admin
 def admin_api_prompt_get():
     prompt_file = config["speech"].get("prompt_file", "prompt.txt")
-    app_dir = Path(__file__).parent.resolve()
-    p = (app_dir / prompt_file).resolve()
-    if not p.is_relative_to(app_dir):
+    p = _resolve_prompt_path(prompt_file)
+    if p is None:
         return jsonify({"status": "error", "message": "Ungültiger Dateipfad"}), 400
     text = p.read_text(encoding="utf-8") if p.exists() else config["speech"].get("prompt", "")
     return jsonify({"prompt": text})
@@ -526,9 +747,8 @@ def admin_api_prompt_set():
     data = request.get_json() or {}
     text = data.get("prompt", "")
     prompt_file = config["speech"].get("prompt_file", "prompt.txt")
-    app_dir = Path(__file__).parent.resolve()
-    p = (app_dir / prompt_file).resolve()
-    if not p.is_relative_to(app_dir):
+    p = _resolve_prompt_path(prompt_file)
+    if p is None:
         return jsonify({"status": "error", "message": "Ungültiger Dateipfad"}), 400
     p.write_text(text, encoding="utf-8")
     config["speech"]["prompt"] = text
@@ -549,6 +769,7 @@ def admin_api_reload():
         old_hours = config["speech"].get("auto_rotate_hours", 0)
         new_hours = new_cfg["speech"].get("auto_rotate_hours", 0)
         config = new_cfg
+        _index_cache.clear()
         if old_hours != new_hours:
             _scheduler.remove_all_jobs()
             if new_hours:
@@ -572,7 +793,12 @@ def admin_api_reload():
 @app.route("/admin/api/logs")
 @_require_admin
 def admin_api_logs():
-    return jsonify({"logs": list(_log_buffer)})
+    with _log_lock:
+        entries = list(_log_buffer)
+    return jsonify({"logs": [
+        {"time": t.strftime("%H:%M:%S"), "level": level, "message": message}
+        for t, level, message in entries
+    ]})
 
 
 # ---------------------------------------------------------------------------
@@ -625,17 +851,28 @@ def admin_api_config_set():
 
     old_arh = config["speech"].get("auto_rotate_hours", 0)
 
+    # Nur tatsächlich geänderte Werte patchen – unveränderte Felder
+    # verursachen sonst unnötige YAML-Dumps
+    updates = [
+        (section, key, value)
+        for section, key, value, old in [
+            ("speech",      "auto_refresh_seconds", ars,  config["speech"]["auto_refresh_seconds"]),
+            ("speech",      "auto_rotate_hours",    arh,  config["speech"]["auto_rotate_hours"]),
+            ("speech.pool", "min_size",             pmin, config["speech"]["pool"]["min_size"]),
+            ("speech.pool", "max_size",             pmax, config["speech"]["pool"]["max_size"]),
+            ("speech.pool", "answers_per_request",  apr,  config["speech"]["pool"]["answers_per_request"]),
+        ]
+        if value != old
+    ]
+
     config["speech"]["auto_refresh_seconds"]         = ars
     config["speech"]["auto_rotate_hours"]            = arh
     config["speech"]["pool"]["min_size"]             = pmin
     config["speech"]["pool"]["max_size"]             = pmax
     config["speech"]["pool"]["answers_per_request"]  = apr
 
-    _patch_yaml_value("speech",      "auto_refresh_seconds", ars)
-    _patch_yaml_value("speech",      "auto_rotate_hours",    arh)
-    _patch_yaml_value("speech.pool", "min_size",             pmin)
-    _patch_yaml_value("speech.pool", "max_size",             pmax)
-    _patch_yaml_value("speech.pool", "answers_per_request",  apr)
+    if updates:
+        _patch_yaml_many(updates)
 
     if old_arh != arh:
         _scheduler.remove_all_jobs()
@@ -660,10 +897,10 @@ def _do_rotate():
     try:
         per_request = config["speech"]["pool"]["answers_per_request"]
         current = load_answers()
-        current = current[per_request:]
+        del current[:per_request]
         raw = generate_answers(config, per_request)
         new_answers = _deduplicate(raw, current) or raw[:max(1, per_request)]
-        current = current + new_answers
+        current.extend(new_answers)
         save_answers(current)
         logger.info("Auto-Rotation: {} alte entfernt, {} neue hinzugefügt. Pool: {}.", per_request, len(new_answers), len(current))
     except Exception as e:
@@ -1,27 +1,52 @@
 import json
 import os
 import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache, wraps
 from pathlib import Path
+from typing import Iterable, Iterator, Optional
 
 import anthropic
+import orjson
 from loguru import logger
 from openai import OpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:  # optionale Beschleunigung – Fallback auf paarweises Jaccard
+    MinHash = MinHashLSH = None
 
 ANSWERS_FILE = Path(__file__).parent / "answers.json"
 
+# Mtime-basierter Cache: erspart Disk-Read + JSON-Parse pro Request,
+# solange sich answers.json nicht geändert hat (ein stat() statt Parse).
+_answers_cache: dict = {"mtime": -1, "data": []}
+_answers_lock = threading.Lock()
+
 
 def load_answers() -> list[str]:
-    if not ANSWERS_FILE.exists():
+    try:
+        st = os.stat(ANSWERS_FILE)
+    except OSError:
         return []
+    if st.st_mtime_ns == _answers_cache["mtime"]:
+        return list(_answers_cache["data"])
     try:
-        with open(ANSWERS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return data.get("answers", [])
-    except (json.JSONDecodeError, OSError) as e:
+        data = orjson.loads(ANSWERS_FILE.read_bytes())
+        answers = data.get("answers", [])
+    except (orjson.JSONDecodeError, OSError) as e:
         logger.warning("answers.json nicht lesbar: {}", e)
         return []
+    _seed_signatures(answers, data.get("signatures"))
+    with _answers_lock:
+        _answers_cache["mtime"] = st.st_mtime_ns
+        _answers_cache["data"] = answers
+    # Kopie zurückgeben – Aufrufer mutieren die Liste (extend, pop, …)
+    return list(answers)
 
 
 def save_answers(answers: list[str]) -> None:
@@ -30,87 +55,333 @@ def save_answers(answers: list[str]) -> None:
         "last_updated": datetime.now().isoformat(),
         "count": len(answers),
     }
-    tmp = ANSWERS_FILE.with_suffix(".tmp")
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(payload, f, ensure_ascii=False, indent=2)
-    tmp.replace(ANSWERS_FILE)  # atomisches Rename auf POSIX
+    if MinHash is not None:
+        # MinHash-Digests mitschreiben: der nächste Kaltstart seeded den
+        # LSH-Index per bytes.fromhex statt den ganzen Pool zu tokenisieren
+        payload["signatures"] = [_minhash_for(a).digest().astype("<u8").tobytes().hex() for a in answers]
+        _prune_signature_cache(answers)
+    # mkstemp statt festem Temp-Namen: eindeutig pro Writer (keine
+    # Kollision konkurrierender Saves), im Zielverzeichnis (Rename bleibt
+    # atomar, kein EXDEV), fsync vor dem Rename, Cleanup bei Fehler
+    fd, tmp = tempfile.mkstemp(prefix=".answers.", suffix=".tmp", dir=ANSWERS_FILE.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # kompakt ohne Einrückung – die Datei wird nur maschinell
+            # gelesen, halbe Dateigröße = halbe Parse-/Schreibzeit
+            f.write(orjson.dumps(payload))
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp legt mit 0600 an – Modus der Zieldatei übernehmen, damit
+        # das Docker-Volume-Mount von außen lesbar bleibt (Backup, Host)
+        try:
+            mode = os.stat(ANSWERS_FILE).st_mode & 0o777
+        except OSError:
+            mode = 0o644  # Erstanlage: üblicher umask-Default
+        os.chmod(tmp, mode)
+        os.replace(tmp, ANSWERS_FILE)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    # Directory-Eintrag persistieren (Best Effort – unter Windows nicht möglich)
+    try:
+        dir_fd = os.open(ANSWERS_FILE.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    except OSError:
+        pass
+    with _answers_lock:
+        _answers_cache["mtime"] = -1  # nächster load_answers liest frisch
+
+
+# Gleiche Mtime-Strategie wie _answers_cache – get_status wird vom
+# Dashboard und /api/status pro Request aufgerufen
+_status_cache: dict = {"mtime": -1, "data": None}
 
 
 def get_status() -> dict:
-    if not ANSWERS_FILE.exists():
+    try:
+        st = os.stat(ANSWERS_FILE)
+    except OSError:
         return {"count": 0, "last_updated": None}
+    if st.st_mtime_ns == _status_cache["mtime"] and _status_cache["data"] is not None:
+        return dict(_status_cache["data"])
     try:
-        with open(ANSWERS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            return {
-                "count": data.get("count", 0),
-                "last_updated": data.get("last_updated"),
-            }
-    except (json.JSONDecodeError, OSError):
+        data = orjson.loads(ANSWERS_FILE.read_bytes())
+        status = {
+            "count": data.get("count", 0),
+            "last_updated": data.get("last_updated"),
+        }
+    except (orjson.JSONDecodeError, OSError):
         return {"count": 0, "last_updated": None}
+    _status_cache["mtime"] = st.st_mtime_ns
+    _status_cache["data"] = status
+    # Kopie – Aufrufer hängen z.B. pool_config an
+    return dict(status)
 
 
+@lru_cache(maxsize=32)
 def _resolve_key(value: str) -> str:
-    """Gibt den API-Key aus der Umgebungsvariablen zurück."""
+    """Gibt den API-Key aus der Umgebungsvariablen zurück (gecacht).
+
+    Wird pro LLM-Call aufgerufen; das Environment ändert sich nur über das
+    Admin-Panel, das dann _resolve_key.cache_clear() aufruft.
+    """
     key = os.environ.get(value)
     if not key:
         raise ValueError(f"API-Key nicht gefunden. Umgebungsvariable '{value}' ist nicht gesetzt.")
     return key
 
 
+# Obergrenze pro LLM-Call: hält eine Deficit-Anfrage im Token-Budget
+_PER_CALL_CAP = 50
+
+
+def _max_tokens(count: int) -> int:
+    """Token-Budget passend zur angefragten Antwortzahl (~40 Token/Tipp)."""
+    return min(4096, 40 * count + 256)
+
+
+# Konstanter Prompt-Text einmal zur Importzeit zusammengesetzt; pro Call
+# wird nur noch die Zahl eingesetzt (%d ist für Int-Substitution in
+# CPython die schnellste Variante)
+_USER_PROMPT_TEMPLATE = (
+    'Generiere genau %d kurze Tipps zu diesem Thema.\n'
+    "Antworte NUR mit einem JSON-Array von Strings, ohne Erklärungen.\n"
+    "Verwende KEIN Markdown, KEINE Sterne, KEINE Unterstriche. Emojis sind erlaubt und erwünscht.\n"
+    "Beginne jeden Tipp NICHT mit einer Nummer oder dem Wort 'Tipp'.\n"
+    'Beispiel: ["Nutze täglich 10 Minuten für KI-Experimente.", "Teile deine Erkenntnisse im Team."]'
+)
+
+
 def _build_prompt(config: dict, count: int) -> tuple[str, str]:
-    system_prompt = config["speech"]["prompt"]
-    user_prompt = (
-        f'Generiere genau {count} kurze Tipps zu diesem Thema.\n'
-        f"Antworte NUR mit einem JSON-Array von Strings, ohne Erklärungen.\n"
-        f"Verwende KEIN Markdown, KEINE Sterne, KEINE Unterstriche. Emojis sind erlaubt und erwünscht.\n"
-        f"Beginne jeden Tipp NICHT mit einer Nummer oder dem Wort 'Tipp'.\n"
-        f'Beispiel: ["Nutze täglich 10 Minuten für KI-Experimente.", "Teile deine Erkenntnisse im Team."]'
-    )
-    return system_prompt, user_prompt
+    return config["speech"]["prompt"], _USER_PROMPT_TEMPLATE % count
 
 
-def _strip_markdown(text: str) -> str:
-    """Entfernt gängige Markdown-Formatierungen aus einem String."""
+# Einmal kompilierte Markdown-Muster – erspart pro Antwort fünf
+# Cache-Lookups im re-Modul
+_MD_PATTERNS: list[tuple[re.Pattern, str]] = [
     # **fett**, *kursiv*, ***beides***
-    text = re.sub(r"\*{1,3}([^*]*)\*{1,3}", r"\1", text)
+    (re.compile(r"\*{1,3}([^*]*)\*{1,3}"), r"\1"),
     # __fett__, _kursiv_
-    text = re.sub(r"_{1,3}([^_]*)_{1,3}", r"\1", text)
+    (re.compile(r"_{1,3}([^_]*)_{1,3}"), r"\1"),
     # # Überschriften
-    text = re.sub(r"^#{1,6}\s+", "", text, flags=re.MULTILINE)
+    (re.compile(r"^#{1,6}\s+", re.MULTILINE), ""),
     # - Listenpunkte am Anfang
-    text = re.sub(r"^\s*[-*]\s+", "", text, flags=re.MULTILINE)
+    (re.compile(r"^\s*[-*]\s+", re.MULTILINE), ""),
     # Numerierungen: "Tipp 1:", "1.", "1)" etc.
-    text = re.sub(r"^\s*Tipp?\s*\d+\s*[:\-.]?\s*", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"^\s*\d+[.)]\s*", "", text)
+    (re.compile(r"^\s*Tipp?\s*\d+\s*[:\-.]?\s*", re.IGNORECASE), ""),
+    (re.compile(r"^\s*\d+[.)]\s*"), ""),
+]
+
+
+def _strip_markdown(text: str) -> str:
+    """Entfernt gängige Markdown-Formatierungen aus einem String."""
+    for pattern, replacement in _MD_PATTERNS:
+        text = pattern.sub(replacement, text)
     return text.strip()
 
 
+_WORD_RE = re.compile(r"\w+")
+
+
+def _token_set(text: str) -> frozenset[str]:
+    """Wort-Token eines Strings als frozenset (lowercase)."""
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+
 def _word_overlap(a: str, b: str) -> float:
     """Jaccard-Ähnlichkeit auf Wortebene (0.0 … 1.0)."""
-    words_a = set(re.findall(r"\w+", a.lower()))
-    words_b = set(re.findall(r"\w+", b.lower()))
+    words_a = _token_set(a)
+    words_b = _token_set(b)
     if not words_a or not words_b:
         return 0.0
-    return len(words_a & words_b) / len(words_a | words_b)
+    inter = len(words_a & words_b)
+    return inter / (len(words_a) + len(words_b) - inter)
+
+
+_MINHASH_PERMS = 64
+
+# LSH-Index-Cache: gültig, solange dieselbe Pool-Liste unverändert
+# weiterwächst (ensure_pool extended in place) – erspart den Neuaufbau
+# des Index pro Batch. Hält die Pool-Liste bewusst stark referenziert
+# (max. max_size Strings), damit der Identitätsvergleich nie auf eine
+# recycelte id() hereinfällt
+_lsh_cache: dict = {"pool": None, "count": 0, "threshold": None, "lsh": None}
+
+
+# Signatur-Cache pro Antworttext: wird beim Laden aus den persistierten
+# Digests gefüllt bzw. beim Deduplizieren on the fly ergänzt
+_signature_cache: dict = {}
+
+
+def _minhash(text: str):
+    mh = MinHash(num_perm=_MINHASH_PERMS)
+    # update_batch hasht alle Token in einem vektorisierten NumPy-Call
+    # statt einmal pro Token durch den Interpreter zu laufen
+    mh.update_batch([token.encode("utf-8") for token in _token_set(text)])
+    return mh
+
+
+def _minhash_for(text: str):
+    """MinHash eines Textes, cache-gestützt."""
+    mh = _signature_cache.get(text)
+    if mh is None:
+        mh = _minhash(text)
+        _signature_cache[text] = mh
+    return mh
+
+
+def _seed_signatures(answers: list, signatures) -> None:
+    """Füllt den Signatur-Cache aus persistierten Hex-Digests."""
+    if MinHash is None or not signatures:
+        return
+    # Feldform defensiv prüfen – eine manipulierte answers.json darf das
+    # Laden nie zum Absturz bringen; Signaturen werden dann neu gerechnet
+    if (
+        not isinstance(signatures, list)
+        or len(signatures) != len(answers)
+        or not all(isinstance(sig, str) for sig in signatures)
+    ):
+        logger.warning("Signaturen in answers.json unbrauchbar – werden neu berechnet.")
+        return
+    import numpy as np
+    try:
+        for text, sig in zip(answers, signatures):
+            if text not in _signature_cache:
+                hashvalues = np.frombuffer(bytes.fromhex(sig), dtype="<u8").copy()
+                _signature_cache[text] = MinHash(num_perm=_MINHASH_PERMS, hashvalues=hashvalues)
+    except (ValueError, TypeError) as e:
+        logger.warning("Signaturen in answers.json unbrauchbar: {}", e)
+
+
+def _prune_signature_cache(answers: list[str]) -> None:
+    """Begrenzt den Signatur-Cache auf den aktuell persistierten Pool."""
+    global _signature_cache
+    _signature_cache = {a: _signature_cache[a] for a in answers if a in _signature_cache}
+
+
+def _deduplicate_lsh(new_answers: list[str], existing: list[str], threshold: float) -> list[str]:
+    """Near-Duplicate-Suche über MinHash-LSH – ~O(1) pro Kandidat statt O(Pool)."""
+    cache = _lsh_cache
+    if cache["pool"] is existing and cache["count"] == len(existing) and cache["threshold"] == threshold:
+        lsh = cache["lsh"]
+    else:
+        lsh = MinHashLSH(threshold=threshold, num_perm=_MINHASH_PERMS)
+        for idx, text in enumerate(existing):
+            lsh.insert(f"p{idx}", _minhash_for(text))
+        cache["pool"] = existing
+        cache["threshold"] = threshold
+        cache["lsh"] = lsh
+    unique = []
+    for candidate in new_answers:
+        mh = _minhash_for(candidate)
+        if not lsh.query(mh):
+            lsh.insert(f"c{len(existing)}-{len(unique)}", mh)
+            unique.append(candidate)
+    # Nach combined.extend(unique) im Aufrufer passt der Index wieder zum Pool
+    cache["count"] = len(existing) + len(unique)
+    return unique
 
 
 def _deduplicate(new_answers: list[str], existing: list[str], threshold: float = 0.6) -> list[str]:
     """Filtert neue Antworten heraus, die zu ähnlich zu vorhandenen sind."""
-    pool = list(existing)
+    # Exakte Wiederholungen (häufigstes LLM-Muster) in O(1) abfangen,
+    # bevor überhaupt Ähnlichkeit gerechnet wird
+    seen = {a.strip().casefold() for a in existing}
+    candidates = []
+    for candidate in new_answers:
+        normalized = candidate.strip().casefold()
+        if normalized in seen:
+            continue
+        seen.add(normalized)
+        candidates.append(candidate)
+    if not candidates:
+        return []
+    new_answers = candidates
+    if MinHashLSH is not None:
+        return _deduplicate_lsh(new_answers, existing, threshold)
+    # Fallback: paarweises Jaccard, aber jeder String wird nur einmal
+    # tokenisiert und Unions werden nie materialisiert
+    pool_tokens: list[tuple[frozenset[str], int]] = [
+        (tokens, len(tokens)) for tokens in map(_token_set, existing)
+    ]
     unique = []
     for candidate in new_answers:
-        if all(_word_overlap(candidate, p) < threshold for p in pool):
+        cand = _token_set(candidate)
+        la = len(cand)
+        duplicate = False
+        if la:
+            for tb, lb in pool_tokens:
+                if not lb:
+                    continue
+                inter = len(cand & tb)
+                if inter and inter / (la + lb - inter) >= threshold:
+                    duplicate = True
+                    break
+        if not duplicate:
             unique.append(candidate)
-            pool.append(candidate)
+            pool_tokens.append((cand, la))
     return unique
 
 
+class _StreamDeduper:
+    """Inkrementelle Deduplizierung für den Streaming-Pfad in ensure_pool.
+
+    Baut Seen-Set und Ähnlichkeits-Index (LSH bzw. Token-Liste) einmal pro
+    Stream auf und hält sie über alle Kandidaten am Leben – _deduplicate
+    würde beides bei jedem Einzelaufruf über den ganzen Pool neu errechnen.
+    """
+
+    def __init__(self, existing: list[str], threshold: float = 0.6):
+        self._threshold = threshold
+        self._seen = {a.strip().casefold() for a in existing}
+        self._added = 0
+        if MinHashLSH is not None:
+            self._lsh = MinHashLSH(threshold=threshold, num_perm=_MINHASH_PERMS)
+            for idx, text in enumerate(existing):
+                self._lsh.insert(f"p{idx}", _minhash_for(text))
+            self._pool_tokens = None
+        else:
+            self._lsh = None
+            self._pool_tokens = [
+                (tokens, len(tokens)) for tokens in map(_token_set, existing)
+            ]
+
+    def accept(self, candidate: str) -> bool:
+        """True, wenn der Kandidat neu ist; nimmt ihn dann in den Index auf."""
+        normalized = candidate.strip().casefold()
+        if normalized in self._seen:
+            return False
+        self._seen.add(normalized)
+        if self._lsh is not None:
+            mh = _minhash_for(candidate)
+            if self._lsh.query(mh):
+                return False
+            self._lsh.insert(f"s{self._added}", mh)
+            self._added += 1
+            return True
+        cand = _token_set(candidate)
+        la = len(cand)
+        if la:
+            for tb, lb in self._pool_tokens:
+                if not lb:
+                    continue
+                inter = len(cand & tb)
+                if inter and inter / (la + lb - inter) >= self._threshold:
+                    return False
+        self._pool_tokens.append((cand, la))
+        return True
+
+
 def _parse_response(raw: str) -> list[str]:
     """Extrahiert ein JSON-Array aus der API-Antwort (robust gegen umgebenden Text)."""
-    raw = raw.strip()
-
-    # Direkter Parse: API hat sauberes JSON geliefert
+    # Direkter Parse: API hat sauberes JSON geliefert (json.loads
+    # toleriert Whitespace – die strip()-Kopie entfällt)
     try:
         answers = json.loads(raw)
         if isinstance(answers, list):
@@ -118,24 +389,14 @@ def _parse_response(raw: str) -> list[str]:
     except json.JSONDecodeError:
         pass
 
-    # Fallback: JSON-Array per Klammer-Zählung extrahieren
+    # Fallback: genau einen JSON-Wert ab der ersten '[' parsen –
+    # raw_decode scannt einmal in C, ohne Slice-Kopien oder
+    # Python-Klammerzählung, und stoppt exakt am Array-Ende
     start = raw.find("[")
     if start == -1:
         raise ValueError(f"Kein JSON-Array in der Antwort: {raw!r}")
-
-    depth = 0
-    end = start
-    for i, ch in enumerate(raw[start:], start):
-        if ch == "[":
-            depth += 1
-        elif ch == "]":
-            depth -= 1
-            if depth == 0:
-                end = i
-                break
-
     try:
-        answers = json.loads(raw[start:end + 1])
+        answers, _ = json.JSONDecoder().raw_decode(raw, start)
     except json.JSONDecodeError as e:
         raise ValueError(f"Ungültiges JSON-Array in der Antwort: {e}") from e
 
@@ -144,35 +405,92 @@ def _parse_response(raw: str) -> list[str]:
     return [_strip_markdown(str(a)) for a in answers if str(a).strip()]
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), reraise=True)
+_MAX_ATTEMPTS = 3
+
+
+def _retry_after_seconds(err: Exception) -> Optional[float]:
+    """Liest die Retry-After-Vorgabe aus einer Provider-Fehlerantwort.
+
+    OpenAI sendet `retry-after` (Sekunden), Anthropic zusätzlich
+    `retry-after-ms`; das HTTP-Date-Format wird nicht unterstützt.
+    """
+    headers = getattr(getattr(err, "response", None), "headers", None)
+    if headers is None:
+        return None
+    for header, scale in (("retry-after-ms", 1000.0), ("retry-after", 1.0)):
+        value = headers.get(header)
+        if value:
+            try:
+                return max(0.0, float(value) / scale)
+            except ValueError:
+                continue
+    return None
+
+
+def _with_retries(fn):
+    """Retry-Decorator: wartet exakt so lange, wie der Provider per
+    Retry-After vorgibt, sonst exponentiell (2s, 4s – wie bisher)."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            try:
+                return fn(*args, **kwargs)
+            except Exception as err:
+                if attempt >= _MAX_ATTEMPTS:
+                    raise
+                wait = _retry_after_seconds(err)
+                if wait is None:
+                    wait = min(10.0, 2.0 ** attempt)
+                else:
+                    wait = min(wait, 30.0)  # Obergrenze: Worker nicht minutenlang parken
+                logger.warning("{}: Versuch {}/{} fehlgeschlagen ({}), warte {:.1f}s.",
+                               fn.__name__, attempt, _MAX_ATTEMPTS, err, wait)
+                time.sleep(wait)
+    return wrapper
+
+
+# Clients pro (Key, URL, Header) wiederverwenden: jeder Konstruktor baut
+# einen eigenen httpx-Pool auf und zahlt beim ersten Request den vollen
+# TCP+TLS-Handshake – Keep-Alive spart 1-2 RTTs pro Folge-Call
+@lru_cache(maxsize=16)
+def _get_openai_client(api_key: str, base_url: Optional[str] = None, headers: tuple = ()) -> OpenAI:
+    return OpenAI(api_key=api_key, base_url=base_url, default_headers=dict(headers) or None)
+
+
+@lru_cache(maxsize=16)
+def _get_anthropic_client(api_key: str) -> anthropic.Anthropic:
+    return anthropic.Anthropic(api_key=api_key)
+
+
+@_with_retries
 def _generate_via_anthropic(provider_cfg: dict, config: dict, count: int) -> list[str]:
     api_key = _resolve_key(provider_cfg.get("api_key_env", ""))
-    client = anthropic.Anthropic(api_key=api_key)
+    client = _get_anthropic_client(api_key)
     system_prompt, user_prompt = _build_prompt(config, count)
     message = client.messages.create(
         model=provider_cfg["model"],
-        max_tokens=1024,
+        max_tokens=_max_tokens(count),
         system=system_prompt,
         messages=[{"role": "user", "content": user_prompt}],
     )
     return _parse_response(message.content[0].text.strip())
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), reraise=True)
+@_with_retries
 def _generate_via_openrouter(provider_cfg: dict, config: dict, count: int) -> list[str]:
     api_key = _resolve_key(provider_cfg.get("api_key_env", ""))
-    client = OpenAI(
+    client = _get_openai_client(
+        api_key,
         base_url="https://openrouter.ai/api/v1",
-        api_key=api_key,
-        default_headers={
-            "HTTP-Referer": provider_cfg.get("site_url", "http://localhost:5000"),
-            "X-Title": provider_cfg.get("site_name", "Mascot App"),
-        },
+        headers=(
+            ("HTTP-Referer", provider_cfg.get("site_url", "http://localhost:5000")),
+            ("X-Title", provider_cfg.get("site_name", "Mascot App")),
+        ),
     )
     system_prompt, user_prompt = _build_prompt(config, count)
     response = client.chat.completions.create(
         model=provider_cfg["model"],
-        max_tokens=1024,
+        max_tokens=_max_tokens(count),
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
@@ -181,14 +499,14 @@ def _generate_via_openrouter(provider_cfg: dict, config: dict, count: int) -> li
     return _parse_response(response.choices[0].message.content.strip())
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), reraise=True)
+@_with_retries
 def _generate_via_openai(provider_cfg: dict, config: dict, count: int) -> list[str]:
     api_key = _resolve_key(provider_cfg.get("api_key_env", ""))
-    client = OpenAI(api_key=api_key)
+    client = _get_openai_client(api_key)
     system_prompt, user_prompt = _build_prompt(config, count)
     response = client.chat.completions.create(
         model=provider_cfg["model"],
-        max_tokens=1024,
+        max_tokens=_max_tokens(count),
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
@@ -197,20 +515,17 @@ def _generate_via_openai(provider_cfg: dict, config: dict, count: int) -> list[s
     return _parse_response(response.choices[0].message.content.strip())
 
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10), reraise=True)
+@_with_retries
 def _generate_via_openai_compat(provider_cfg: dict, config: dict, count: int) -> list[str]:
     """Generischer OpenAI-kompatibler Provider (Mistral, DeepSeek, xAI, Ollama, …)."""
     api_key_env = provider_cfg.get("api_key_env", "")
     # Lokale Provider (Ollama, LM Studio) benötigen keinen echten API-Key
     resolved_key = os.environ.get(api_key_env, "no-key") if api_key_env else "no-key"
-    client = OpenAI(
-        api_key=resolved_key,
-        base_url=provider_cfg["base_url"],
-    )
+    client = _get_openai_client(resolved_key, base_url=provider_cfg["base_url"])
     system_prompt, user_prompt = _build_prompt(config, count)
     response = client.chat.completions.create(
         model=provider_cfg["model"],
-        max_tokens=1024,
+        max_tokens=_max_tokens(count),
         messages=[
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
@@ -254,11 +569,122 @@ def generate_answers(config: dict, count: int) -> list[str]:
         raise
 
 
+def _iter_json_array(chunks: Iterable[str]) -> Iterator[str]:
+    """Parst Array-Elemente inkrementell aus einem Text-Chunk-Stream.
+
+    Liefert jedes Element, sobald es vollständig im Puffer angekommen
+    ist – so kann die Deduplizierung laufen, während der Provider noch
+    Tokens generiert.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    started = False
+    for chunk in chunks:
+        buf += chunk
+        if not started:
+            start = buf.find("[")
+            if start == -1:
+                continue
+            pos = start + 1
+            started = True
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buf) or buf[pos] == "]":
+                break
+            try:
+                value, pos = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                break  # Element noch unvollständig – auf nächsten Chunk warten
+            yield str(value)
+
+
+def _stream_chat_completion(provider_cfg: dict, ptype: str, config: dict, count: int) -> Iterator[str]:
+    """Streamt Text-Deltas eines OpenAI-kompatiblen Chat-Completions-Calls."""
+    if ptype == "openrouter":
+        client = _get_openai_client(
+            _resolve_key(provider_cfg.get("api_key_env", "")),
+            base_url="https://openrouter.ai/api/v1",
+            headers=(
+                ("HTTP-Referer", provider_cfg.get("site_url", "http://localhost:5000")),
+                ("X-Title", provider_cfg.get("site_name", "Mascot App")),
+            ),
+        )
+    elif ptype == "openai":
+        client = _get_openai_client(_resolve_key(provider_cfg.get("api_key_env", "")))
+    else:
+        api_key_env = provider_cfg.get("api_key_env", "")
+        resolved_key = os.environ.get(api_key_env, "no-key") if api_key_env else "no-key"
+        client = _get_openai_client(resolved_key, base_url=provider_cfg["base_url"])
+    system_prompt, user_prompt = _build_prompt(config, count)
+    stream = client.chat.completions.create(
+        model=provider_cfg["model"],
+        max_tokens=_max_tokens(count),
+        messages=[
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt},
+        ],
+        stream=True,
+    )
+    try:
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+    finally:
+        # schließt die HTTP-Verbindung auch bei vorzeitigem Abbruch
+        stream.close()
+
+
+def generate_answers_stream(config: dict, count: int) -> Iterator[str]:
+    """Generator-Variante von generate_answers: liefert Tipps einzeln,
+    während der Provider noch streamt.
+
+    Nur OpenAI-kompatible Provider streamen; andere (Anthropic) fallen
+    auf die Batch-Variante zurück und liefern am Stück.
+    """
+    provider_name = config["ai"]["provider"]
+    providers = config.get("providers", {})
+    provider_cfg = providers.get(provider_name)
+    ptype = (provider_cfg or {}).get("type", "anthropic")
+    if provider_cfg is None or ptype not in ("openai", "openai_compat", "openrouter"):
+        yield from generate_answers(config, count)
+        return
+    try:
+        chunks = _stream_chat_completion(provider_cfg, ptype, config, count)
+        for item in _iter_json_array(chunks):
+            cleaned = _strip_markdown(item)
+            if cleaned:
+                yield cleaned
+    except Exception as err:
+        logger.warning("Streaming über '{}' fehlgeschlagen ({}). Fallback auf Batch-Call.", provider_name, err)
+        yield from generate_answers(config, count)
+
+
+def generate_answers_parallel(config: dict, count: int, batch_size: int, workers: int = 4) -> list[str]:
+    """Generiert `count` Antworten in parallelen Batches à `batch_size`.
+
+    Die Provider-SDKs geben den GIL während des HTTP-I/O frei, daher
+    überlappen sich die Round-Trips statt sich zu addieren.
+    """
+    if count <= batch_size:
+        return generate_answers(config, count)
+    counts = [batch_size] * (count // batch_size)
+    if count % batch_size:
+        counts.append(count % batch_size)
+    results: list[str] = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(generate_answers, config, c) for c in counts]
+        for fut in as_completed(futures):
+            results.extend(fut.result())
+    return results
+
+
 def ensure_pool(config: dict) -> dict:
     """Füllt den Pool bis max_size auf. Gibt Status zurück."""
     pool_cfg = config["speech"]["pool"]
     max_size = pool_cfg["max_size"]
-    per_request = pool_cfg["answers_per_request"]
 
     combined = load_answers()
 
@@ -268,12 +694,47 @@ def ensure_pool(config: dict) -> dict:
     total_generated = 0
     max_retries = 5
     retries = 0
+    workers = 4
 
+    # Das gesamte Defizit auf einmal anfragen: bis _PER_CALL_CAP als ein
+    # Call, darüber in parallelen Batches (ThreadPoolExecutor – die SDKs
+    # geben den GIL während des HTTP-I/O frei). Batches werden
+    # dedupliziert, sobald sie eintreffen, nicht erst am Ende.
     while len(combined) < max_size:
-        needed = min(per_request, max_size - len(combined))
-        raw_answers = generate_answers(config, needed)
-        new_answers = _deduplicate(raw_answers, combined)
-        if not new_answers:
+        needed = min(max_size - len(combined), _PER_CALL_CAP * workers)
+        raw_answers: list[str] = []
+        got_new = False
+        if needed > _PER_CALL_CAP:
+            counts = [_PER_CALL_CAP] * (needed // _PER_CALL_CAP)
+            if needed % _PER_CALL_CAP:
+                counts.append(needed % _PER_CALL_CAP)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(generate_answers, config, c) for c in counts]
+                for fut in as_completed(futures):
+                    batch = fut.result()
+                    raw_answers.extend(batch)
+                    new_answers = _deduplicate(batch, combined)
+                    combined.extend(new_answers)
+                    total_generated += len(new_answers)
+                    got_new = got_new or bool(new_answers)
+        else:
+            # Streamen und pro Tipp sofort deduplizieren; ist das Ziel
+            # erreicht, wird der Stream geschlossen und der Provider
+            # generiert keine Tokens mehr, die ohnehin verworfen würden
+            deduper = _StreamDeduper(combined)
+            stream = generate_answers_stream(config, needed)
+            try:
+                for candidate in stream:
+                    raw_answers.append(candidate)
+                    if deduper.accept(candidate):
+                        combined.append(candidate)
+                        total_generated += 1
+                        got_new = True
+                        if len(combined) >= max_size:
+                            break
+            finally:
+                stream.close()
+        if not got_new:
             retries += 1
             if retries >= max_retries:
                 logger.warning("ensure_pool: Abbruch nach {} Deduplizierungs-Fehlschlägen.", max_retries)
@@ -284,8 +745,6 @@ def ensure_pool(config: dict) -> dict:
             # Nochmal versuchen, ohne Duplikate einzufügen
             continue
         retries = 0
-        combined.extend(new_answers)
-        total_generated += len(new_answers)
 
     save_answers(combined)
     return {"generated": total_generated, "total": len(combined), "action": "generated"}